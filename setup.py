@@ -64,7 +64,7 @@ setup(
     include_package_data=True,
     python_requires='>=3.6',
     install_requires=requires,
-    tests_require=['pytest', 'pytest-cov'],
+    tests_require=['pytest', 'pytest-cov', 'pytest-xdist'],
     namespace_packages=['sphinxcontrib'],
     entry_points={
         'pybtex.style.names': [
@@ -67,7 +67,7 @@ def setup(app: Sphinx) -> Dict[str, Any]:
 
     return {
         'version': '2.5.1a0',
-        'env_version': 9,
+        'env_version': 10,
         'parallel_read_safe': True,
         'parallel_write_safe': True,
         }
@@ -17,7 +17,7 @@
 """
 import math
 import os.path
-from typing import TYPE_CHECKING, Dict, NamedTuple, List, Set
+from typing import TYPE_CHECKING, Dict, NamedTuple, List, Set, Tuple
 
 from docutils.nodes import make_id
 from pybtex.database.input.bibtex import Parser
@@ -25,6 +25,7 @@ from pybtex.database import BibliographyData, BibliographyDataError
 from sphinx.util.logging import getLogger
 
 if TYPE_CHECKING:
+    from pybtex.database import Entry
     from sphinx.environment import BuildEnvironment
 
 
@@ -33,8 +34,13 @@ logger = getLogger(__name__)
 
 class BibFile(NamedTuple):
     """Contains information about a parsed bib file."""
-    mtime: float           #: Modification time of file when last parsed.
-    keys: Dict[str, None]  #: Set of keys for this bib file as ordered dict.
+    mtime: float  #: Modification time of file when last parsed.
+    entries: Tuple["Entry", ...]  #: Entries for this bib file, in order.
+
+    @property
+    def keys(self) -> Dict[str, None]:
+        """Set of keys for this bib file as ordered dict."""
+        return dict.fromkeys(entry.key for entry in self.entries)
 
 
 class BibData(NamedTuple):
@@ -67,7 +73,7 @@ def parse_bibdata(bibfilenames: List[str], encoding: str) -> BibData:
             logger.warning(
                 "could not open bibtex file {0}.".format(filename),
                 type="bibtex", subtype="bibfile_error")
-            new_keys: Dict[str, None] = {}
+            new_entries: Tuple["Entry", ...] = ()
         else:
             try:
                 parser.parse_file(filename)
@@ -78,10 +84,12 @@ def parse_bibdata(bibfilenames: List[str], encoding: str) -> BibData:
                     type="bibtex", subtype="bibfile_data_error")
             keys, old_keys = dict.fromkeys(parser.data.entries.keys()), keys
             assert all(key in keys for key in old_keys)
-            new_keys = dict.fromkeys(
-                key for key in keys if key not in old_keys)
-            logger.info("parsed {0} entries".format(len(new_keys)))
-        bibfiles[filename] = BibFile(mtime=get_mtime(filename), keys=new_keys)
+            new_entries = tuple(
+                parser.data.entries[key] for key in keys
+                if key not in old_keys)
+            logger.info("parsed {0} entries".format(len(new_entries)))
+        bibfiles[filename] = BibFile(
+            mtime=get_mtime(filename), entries=new_entries)
     return BibData(encoding=encoding, bibfiles=bibfiles, data=parser.data)
 
 
@@ -10,7 +10,8 @@
         .. automethod:: run
 """
 
-from typing import TYPE_CHECKING, cast, NamedTuple, List, Dict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast, NamedTuple, List, Dict, Set
 from docutils.parsers.rst import Directive
 import docutils.parsers.rst.directives as directives
 
@@ -19,6 +20,7 @@ import docutils.nodes
 import sphinx.util
 
 from .bibfile import normpath_filename, _make_ids
+from .domain import compile_filter
 from .nodes import bibliography as bibliography_node
 
 if TYPE_CHECKING:
@@ -35,8 +37,12 @@ class BibliographyKey(NamedTuple):
     id_: str      #: The id of the bibliography node in the document.
 
 
-class BibliographyValue(NamedTuple):
+@dataclass
+class BibliographyValue:
     """Contains information about a bibliography directive."""
+    __slots__ = (
+        'line', 'bibfiles', 'style', 'list_', 'enumtype', 'start',
+        'labelprefix', 'keyprefix', 'filter_', 'citation_nodes', 'keys')
     line: int            #: Line number of the directive in the document.
     bibfiles: List[str]  #: List of bib files for this directive.
     style: str           #: The pybtex style.
@@ -88,6 +94,31 @@ class BibliographyDirective(Directive):
         'keyprefix': directives.unchanged,
     }
 
+    def _parse_filter(self, env: "BuildEnvironment", source: str) -> ast.AST:
+        """Parse and validate a :filter: expression, falling back to the
+        default filter with a warning if it is invalid.
+        """
+        try:
+            filter_ = ast.parse(source)
+        except SyntaxError:
+            logger.warning(
+                "syntax error in :filter: expression" +
+                " (" + source + "); "
+                "the option will be ignored",
+                location=(env.docname, self.lineno),
+                type="bibtex", subtype="filter_syntax_error")
+            return ast.parse("cited")
+        try:
+            compile_filter(filter_)
+        except ValueError as err:
+            logger.warning(
+                "syntax error in :filter: expression; %s; "
+                "the option will be ignored" % err,
+                location=(env.docname, self.lineno),
+                type="bibtex", subtype="filter_syntax_error")
+            return ast.parse("cited")
+        return filter_
+
     def _get_filter(self):
         """Get parsed filter from options."""
         env = cast("BuildEnvironment", self.state.document.settings.env)
@@ -105,16 +136,7 @@ class BibliographyDirective(Directive):
                 logger.warning(":filter: overrides :cited:",
                                location=(env.docname, self.lineno),
                                type="bibtex", subtype="filter_overrides")
-            try:
-                return ast.parse(self.options["filter"])
-            except SyntaxError:
-                logger.warning(
-                    "syntax error in :filter: expression" +
-                    " (" + self.options["filter"] + "); "
-                    "the option will be ignored",
-                    location=(env.docname, self.lineno),
-                    type="bibtex", subtype="filter_syntax_error")
-                return ast.parse("cited")
+            return self._parse_filter(env, self.options["filter"])
         elif "all" in self.options:
             return ast.parse("True")
         elif "notcited" in self.options:
@@ -123,6 +145,30 @@ class BibliographyDirective(Directive):
             # the default filter: include only cited entries
             return ast.parse("cited")
 
+    def _make_citation_nodes(
+            self, env: "BuildEnvironment", domain: "BibtexDomain",
+            bibfiles: List[str], keyprefix: str, citation_node_class,
+            ids: Set[str], bibliography_count: int
+            ) -> Dict[str, docutils.nodes.Element]:
+        """Create an (empty) citation node, with its id, for every entry
+        of the given bib files.
+        """
+        # local variables avoid attribute lookups for every entry
+        docname: str = env.docname
+        lineno: int = self.lineno
+        cite_id: str = env.app.config.bibtex_cite_id
+        citation_nodes: Dict[str, docutils.nodes.Element] = {}
+        for entry in domain.get_entries(bibfiles):
+            key = keyprefix + entry.key
+            citation_nodes[key] = citation_node_class(ids=_make_ids(
+                docname=docname,
+                lineno=lineno,
+                ids=ids,
+                raw_id=cite_id.format(
+                    bibliography_count=bibliography_count,
+                    key=key) if cite_id else ""))
+        return citation_nodes
+
     def run(self):
         """Process .bib files, set file dependencies, and create a
         node that is to be transformed to the entries of the
@@ -173,16 +219,9 @@ class BibliographyDirective(Directive):
         # we only know which citations to included at resolve stage
         # but we need to know their ids before resolve stage
         # so for now we generate a node, and thus, an id, for every entry
-        citation_nodes: Dict[str, docutils.nodes.Element] = {
-            keyprefix + entry.key:
-                citation_node_class(ids=_make_ids(
-                    docname=env.docname,
-                    lineno=self.lineno,
-                    ids=ids,
-                    raw_id=env.app.config.bibtex_cite_id.format(
-                        bibliography_count=bibliography_count,
-                        key=keyprefix + entry.key)))
-            for entry in domain.get_entries(bibfiles)}
+        citation_nodes = self._make_citation_nodes(
+            env, domain, bibfiles, keyprefix, citation_node_class, ids,
+            bibliography_count)
         for citation_node in citation_nodes.values():
             self.state.document.note_explicit_target(
                 citation_node, citation_node)
@@ -7,11 +7,16 @@
 
     .. autoclass:: BibtexDomain
         :members:
+
+    .. autofunction:: find_formatting_style
 """
 
 import ast
+import functools
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
-from typing import List, Dict, NamedTuple, cast, Iterable, Tuple, Set, Optional
+from typing import List, Dict, cast, Iterable, Tuple, Set, Optional
+from typing import Any, Callable, FrozenSet, Pattern, Type
 
 import docutils.frontend
 import docutils.nodes
@@ -48,6 +53,8 @@ if TYPE_CHECKING:
 
 logger = sphinx.util.logging.getLogger(__name__)
 
+_EMPTY_DOCNAMES: FrozenSet[str] = frozenset()
+
 
 def _raise_invalid_node(node):
     """Helper method to raise an exception when an invalid node is
@@ -56,20 +63,97 @@ def _raise_invalid_node(node):
     raise ValueError("invalid node %s in filter expression" % node)
 
 
-class _FilterVisitor(ast.NodeVisitor):
+@functools.lru_cache(maxsize=512)
+def _compile_icase(pattern: str) -> Pattern:
+    """Compile case insensitive regular expression, with caching."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _filter_regex(left, right):
+    """Regular expression match, as used by the modulo operator in
+    compiled filter expressions.
+    """
+    if not isinstance(left, str):
+        raise ValueError("expected a string on left side of %")
+    if not isinstance(right, str):
+        raise ValueError("expected a string on right side of %")
+    return _compile_icase(right).search(left)
+
 
-    """Visit the abstract syntax tree of a parsed filter expression."""
+def _filter_regex_compiled(left, right: Pattern):
+    """As :func:`_filter_regex`, but for an already compiled pattern."""
+    if not isinstance(left, str):
+        raise ValueError("expected a string on left side of %")
+    return right.search(left)
 
-    entry = None
-    """The bibliographic entry to which the filter must be applied."""
 
-    cited_docnames = False
-    """The documents where the entry is cited (empty if not cited)."""
+def _filter_persons(entry, role):
+    """Persons of the given *role*, as used in compiled filter
+    expressions.
+    """
+    if role in entry.persons:
+        return u' and '.join(
+            str(person)  # XXX needs fix in pybtex?
+            for person in entry.persons[role])
+    else:
+        return u''
+
+
+# python operators for the comparisons supported in filter expressions
+# not used currently: ast.Is | ast.IsNot
+_filter_compare_ops: Dict[type, str] = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+
+# python operators for the set operations supported in filter expressions
+# (ast.Mod is handled separately, for regular expression matching)
+_filter_binary_ops: Dict[type, str] = {
+    ast.BitOr: "|",
+    ast.BitAnd: "&",
+}
+
+# python expressions for the special identifiers in filter expressions
+# (any other identifier refers to a field of the entry)
+_filter_names: Dict[str, str] = {
+    'type': "entry.type",  # pybtex already stores the type in lower case
+    'key': "entry.key.lower()",
+    'cited': "bool(cited_docnames)",
+    'docname': "docname",
+    'docnames': "cited_docnames",
+    'author': "_filter_persons(entry, 'author')",
+    'editor': "_filter_persons(entry, 'editor')",
+}
+
+
+FilterFunction = Callable[["Entry", str, FrozenSet[str]], Any]
 
-    def __init__(self, entry, docname, cited_docnames):
-        self.entry = entry
-        self.docname = docname
-        self.cited_docnames = cited_docnames
+
+class _FilterVisitor(ast.NodeVisitor):
+
+    """Visit the abstract syntax tree of a parsed filter expression,
+    and translate it into the source of a python expression
+    in terms of ``entry``, ``docname``, and ``cited_docnames``.
+    Constants are stored in :attr:`namespace`.
+    """
+
+    def __init__(self):
+        self.namespace: Dict[str, Any] = dict(
+            _filter_regex=_filter_regex,
+            _filter_regex_compiled=_filter_regex_compiled,
+            _filter_persons=_filter_persons,
+        )
+
+    def constant(self, value) -> str:
+        name = "_c%d" % len(self.namespace)
+        self.namespace[name] = value
+        return name
 
     def visit_Module(self, node):
         if len(node.body) != 1:
@@ -81,19 +165,20 @@ class _FilterVisitor(ast.NodeVisitor):
         return self.visit(node.value)
 
     def visit_BoolOp(self, node):
-        outcomes = (self.visit(value) for value in node.values)
         if isinstance(node.op, ast.And):
-            return all(outcomes)
+            op = " and "
         elif isinstance(node.op, ast.Or):
-            return any(outcomes)
+            op = " or "
         else:  # pragma: no cover
             # there are no other boolean operators
             # so this code should never execute
             assert False, "unexpected boolean operator %s" % node.op
+        return "bool(%s)" % op.join(
+            self.visit(value) for value in node.values)
 
     def visit_UnaryOp(self, node):
         if isinstance(node.op, ast.Not):
-            return not self.visit(node.operand)
+            return "(not %s)" % self.visit(node.operand)
         else:
             _raise_invalid_node(node)
 
@@ -103,19 +188,29 @@ class _FilterVisitor(ast.NodeVisitor):
         right = self.visit(node.right)
         if isinstance(op, ast.Mod):
             # modulo operator is used for regular expression matching
-            if not isinstance(left, str):
-                raise ValueError(
-                    "expected a string on left side of %s" % node.op)
-            if not isinstance(right, str):
-                raise ValueError(
-                    "expected a string on right side of %s" % node.op)
-            return re.search(right, left, re.IGNORECASE)
-        elif isinstance(op, ast.BitOr):
-            return left | right
-        elif isinstance(op, ast.BitAnd):
-            return left & right
-        else:
+            # constants are looked up by name, so this check does not
+            # depend on the ast node class used for literals (which
+            # differs between python versions)
+            for side, source in [("left", left), ("right", right)]:
+                if (source in self.namespace
+                        and not isinstance(self.namespace[source], str)):
+                    raise ValueError(
+                        "expected a string on %s side of %%" % side)
+            pattern = self.namespace.get(right)
+            if isinstance(pattern, str):
+                # constant pattern, so compile it only once
+                try:
+                    self.namespace[right] = _compile_icase(pattern)
+                except re.error as err:
+                    raise ValueError(
+                        "invalid regular expression %s (%s)" % (
+                            repr(pattern), err))
+                return "_filter_regex_compiled(%s, %s)" % (left, right)
+            return "_filter_regex(%s, %s)" % (left, right)
+        binary_op = _filter_binary_ops.get(type(op))
+        if binary_op is None:
             _raise_invalid_node(node)
+        return "(%s %s %s)" % (left, binary_op, right)
 
     def visit_Compare(self, node):
         # keep it simple: binary comparators only
@@ -124,69 +219,74 @@ class _FilterVisitor(ast.NodeVisitor):
         left = self.visit(node.left)
         op = node.ops[0]
         right = self.visit(node.comparators[0])
-        if isinstance(op, ast.Eq):
-            return left == right
-        elif isinstance(op, ast.NotEq):
-            return left != right
-        elif isinstance(op, ast.Lt):
-            return left < right
-        elif isinstance(op, ast.LtE):
-            return left <= right
-        elif isinstance(op, ast.Gt):
-            return left > right
-        elif isinstance(op, ast.GtE):
-            return left >= right
-        elif isinstance(op, ast.In):
-            return left in right
-        elif isinstance(op, ast.NotIn):
-            return left not in right
-        else:
-            # not used currently: ast.Is | ast.IsNot
+        compare_op = _filter_compare_ops.get(type(op))
+        if compare_op is None:
             _raise_invalid_node(op)
+        return "(%s %s %s)" % (left, compare_op, right)
 
     def visit_Name(self, node):
-        """Calculate the value of the given identifier."""
-        id_ = node.id
-        if id_ == 'type':
-            return self.entry.type.lower()
-        elif id_ == 'key':
-            return self.entry.key.lower()
-        elif id_ == 'cited':
-            return bool(self.cited_docnames)
-        elif id_ == 'docname':
-            return self.docname
-        elif id_ == 'docnames':
-            return self.cited_docnames
-        elif id_ == 'author' or id_ == 'editor':
-            if id_ in self.entry.persons:
-                return u' and '.join(
-                    str(person)  # XXX needs fix in pybtex?
-                    for person in self.entry.persons[id_])
-            else:
-                return u''
-        else:
-            return self.entry.fields.get(id_, "")
+        """Translate the given identifier."""
+        try:
+            return _filter_names[node.id]
+        except KeyError:
+            return "entry.fields.get(%s, '')" % self.constant(node.id)
 
     def visit_Set(self, node):
-        return frozenset(self.visit(elt) for elt in node.elts)
+        return "frozenset((%s,))" % ", ".join(
+            self.visit(elt) for elt in node.elts)
 
     # NameConstant is Python 3.4 only
     def visit_NameConstant(self, node):
-        return node.value  # pragma: no cover
+        return self.constant(node.value)  # pragma: no cover
 
     # Constant is Python 3.6+ only
     # Since 3.8 Num, Str, Bytes, NameConstant and Ellipsis are just Constant
     def visit_Constant(self, node):
-        return node.value
+        return self.constant(node.value)
 
     # Not used on 3.8+
     def visit_Str(self, node):
-        return node.s  # pragma: no cover
+        return self.constant(node.s)  # pragma: no cover
 
     def generic_visit(self, node):
         _raise_invalid_node(node)
 
 
+_filter_functions: Dict[str, FilterFunction] = {}
+
+
+def compile_filter(filter_: ast.AST) -> FilterFunction:
+    """Compile a parsed filter expression into a function taking an entry,
+    the name of the document of the bibliography, and the names of the
+    documents where the entry is cited. Functions are cached, so identical
+    filter expressions share the same function.
+
+    :raises ValueError: If the filter expression is invalid.
+    """
+    source = ast.dump(filter_)
+    try:
+        return _filter_functions[source]
+    except KeyError:
+        visitor = _FilterVisitor()
+        code = compile(
+            "lambda entry, docname, cited_docnames: " + visitor.visit(filter_),
+            "<filter>", "eval")
+        func = _filter_functions[source] = eval(code, visitor.namespace)
+        return func
+
+
+# function used by both cite and footcite roles, residing here for now
+# note: the class is cached by name, so re-registering a style under
+# the same name with pybtex's register_plugin(..., force=True) is not
+# picked up for the rest of the process (call cache_clear() if needed)
+@functools.lru_cache(maxsize=None)
+def find_formatting_style(name: str) -> Type["BaseStyle"]:
+    """Find pybtex formatting style plugin class, with caching, because
+    looking up entry points is slow.
+    """
+    return pybtex.plugin.find_plugin('pybtex.style.formatting', name)
+
+
 def get_docnames(env):
     """Get document names in order."""
     rel = env.collect_relations()
@@ -203,8 +303,12 @@ def get_docnames(env):
         yield docname
 
 
-class Citation(NamedTuple):
+@dataclass
+class Citation:
     """Information about a citation."""
+    __slots__ = (
+        'citation_id', 'bibliography_key', 'key', 'entry',
+        'formatted_entry', 'tooltip_entry')
     citation_id: str                     #: Unique id of this citation.
     bibliography_key: "BibliographyKey"  #: Key of its bibliography directive.
     key: str                             #: Key (with prefix).
@@ -218,7 +322,8 @@ def env_updated(app: "Sphinx", env: "BuildEnvironment") -> Iterable[str]:
     return domain.env_updated()
 
 
-def parse_header(header: str, source_path: str):
+@functools.lru_cache(maxsize=32)
+def _parse_header(header: str, source_path: str):
     parser = docutils.parsers.rst.Parser()
     # note: types stub for docutils doesn't know about components argument
     settings = docutils.frontend.OptionParser(
@@ -229,12 +334,17 @@ def parse_header(header: str, source_path: str):
     return document[0]
 
 
+def parse_header(header: str, source_path: str):
+    # parsing is cached, so return a copy that callers are free to modify
+    return _parse_header(header, source_path).deepcopy()
+
+
 class BibtexDomain(Domain):
     """Sphinx domain for the bibtex extension."""
 
     name = 'cite'
     label = 'BibTeX Citations'
-    data_version = 4
+    data_version = 8
     initial_data = dict(
         bibdata=BibData(
             encoding='',
@@ -243,10 +353,23 @@ class BibtexDomain(Domain):
         bibliography_header=docutils.nodes.container(),
         bibliographies={},
         citations=[],
-        citation_refs=[],
+        citation_refs={},
     )
     backend = pybtex_docutils.Backend()
+    plaintext = pybtex.plugin.find_plugin('pybtex.backends', 'plaintext')()
     reference_style: BaseReferenceStyle
+    #: Maps each bibliography to its citations.
+    #: Calculated in :meth:`env_updated`.
+    bibliography_citations: Dict["BibliographyKey", List[Citation]]
+    #: Maps each key to its position and citation, for citation lists only.
+    #: Calculated in :meth:`env_updated`.
+    citation_index: Dict[str, Tuple[int, Citation]]
+    #: Maps each key to the documents where it is cited;
+    #: calculated on demand, and reset whenever citation references change.
+    cited_docnames: Optional[Dict[str, FrozenSet[str]]]
+    #: Maps document names to all keys cited in these documents, in order,
+    #: without duplicates; reset whenever citation references change.
+    sorted_cited_keys: Dict[Tuple[str, ...], List[str]]
 
     @property
     def bibdata(self) -> BibData:
@@ -268,8 +391,8 @@ class BibtexDomain(Domain):
         return self.data['citations']
 
     @property
-    def citation_refs(self) -> List["CitationRef"]:
-        """Citation reference data."""
+    def citation_refs(self) -> Dict[str, List["CitationRef"]]:
+        """Citation reference data, for each document."""
         return self.data['citation_refs']
 
     def __init__(self, env: "BuildEnvironment"):
@@ -284,6 +407,9 @@ class BibtexDomain(Domain):
             citation=ObjType(_('citation'), *role_names, searchprio=-1),
         )
         self.roles = dict((name, CiteRole()) for name in role_names)
+        self.bibliography_citations = {}
+        self.citation_index = {}
+        self._reset_citation_ref_caches()
         # initialize the domain
         super().__init__(env)
         # connect env-updated
@@ -304,23 +430,38 @@ class BibtexDomain(Domain):
             self.data["bibliography_header"] += \
                 parse_header(header, "bibliography_header")
 
+    def _reset_citation_ref_caches(self) -> None:
+        """Invalidate all caches derived from :attr:`citation_refs`.
+
+        :class:`~sphinxcontrib.bibtex.roles.CiteRole` appends to
+        :attr:`citation_refs` without calling this.
+        That is safe only because these caches are first read
+        after :meth:`env_updated` has reset them.
+        """
+        self.cited_docnames = None
+        self.sorted_cited_keys = {}
+
     def clear_doc(self, docname: str) -> None:
-        self.data['citations'] = [
-            citation for citation in self.citations
-            if citation.bibliography_key.docname != docname]
-        self.data['citation_refs'] = [
-            ref for ref in self.citation_refs if ref.docname != docname]
-        for bib_key in list(self.bibliographies.keys()):
-            if bib_key.docname == docname:
+        self._reset_citation_ref_caches()
+        self.citation_refs.pop(docname, None)
+        bib_keys = {bib_key for bib_key in self.bibliographies
+                    if bib_key.docname == docname}
+        if bib_keys:
+            for bib_key in bib_keys:
                 del self.bibliographies[bib_key]
+            self.data['citations'] = [
+                citation for citation in self.citations
+                if citation.bibliography_key not in bib_keys]
 
     def merge_domaindata(self, docnames: List[str], otherdata: Dict) -> None:
+        self._reset_citation_ref_caches()
+        docnames_set = frozenset(docnames)
         for bib_key, bib_value in otherdata['bibliographies'].items():
-            if bib_key.docname in docnames:
+            if bib_key.docname in docnames_set:
                 self.bibliographies[bib_key] = bib_value
-        for citation_ref in otherdata['citation_refs']:
-            if citation_ref.docname in docnames:
-                self.citation_refs.append(citation_ref)
+        for docname, citation_refs in otherdata['citation_refs'].items():
+            if docname in docnames_set:
+                self.citation_refs[docname] = citation_refs
         # 'citations' domain data calculated in env_updated
 
     def env_updated(self) -> Iterable[str]:
@@ -331,6 +472,7 @@ class BibtexDomain(Domain):
         # the labels here because they must be known when resolve_xref is
         # called.
         self.citations.clear()  # might have been restored from pickle
+        self._reset_citation_ref_caches()
         docnames = list(get_docnames(self.env))
         # we keep track of this to quickly check for duplicates
         used_keys: Set[str] = set()
@@ -369,6 +511,19 @@ class BibtexDomain(Domain):
                             location=(bibliography_key.docname,
                                       bibliography.line),
                             type="bibtex", subtype="duplicate_label")
+        # index citations for fast lookup in transforms and resolve_xref
+        # in case of duplicate keys, the last citation wins,
+        # at the position of the first one
+        self.bibliography_citations = {}
+        self.citation_index = {}
+        for citation in self.citations:
+            self.bibliography_citations.setdefault(
+                citation.bibliography_key, []).append(citation)
+            if self.bibliographies[
+                    citation.bibliography_key].list_ == 'citation':
+                position = self.citation_index.get(
+                    citation.key, (len(self.citation_index), citation))[0]
+                self.citation_index[citation.key] = (position, citation)
         return []  # expects list of updated docnames
 
     def resolve_xref(self, env: "BuildEnvironment", fromdocname: str,
@@ -377,16 +532,16 @@ class BibtexDomain(Domain):
                      ) -> docutils.nodes.Element:
         """Replace node by list of citation references (one for each key)."""
         keys = [key.strip() for key in target.split(',')]
-        citations: Dict[str, Citation] = {
-            cit.key: cit for cit in self.citations
-            if cit.key in keys
-            and self.bibliographies[cit.bibliography_key].list_ == 'citation'}
         for key in keys:
-            if key not in citations:
+            if key not in self.citation_index:
                 logger.warning('could not find bibtex key "%s"' % key,
                                location=node, type="bibtex",
                                subtype="key_not_found")
-        plaintext = pybtex.plugin.find_plugin('pybtex.backends', 'plaintext')()
+        # citations are ordered as in the bibliographies
+        citations: List[Citation] = [
+            citation for position, citation in sorted(
+                self.citation_index[key] for key in set(keys)
+                if key in self.citation_index)]
         references = [
             (citation.entry, citation.formatted_entry, SphinxReferenceInfo(
                 builder=builder,
@@ -394,12 +549,12 @@ class BibtexDomain(Domain):
                 todocname=citation.bibliography_key.docname,
                 citation_id=citation.citation_id,
                 title=(
-                    citation.tooltip_entry.text.render(plaintext).replace(
-                        "\\url ", "")
+                    citation.tooltip_entry.text.render(
+                        self.plaintext).replace("\\url ", "")
                     if citation.tooltip_entry else None
                 )
             ))
-            for citation in citations.values()]
+            for citation in citations]
         formatted_references = format_references(
             self.reference_style, typ, references)
         result_node = docutils.nodes.inline(rawsource=target)
@@ -414,11 +569,7 @@ class BibtexDomain(Domain):
         provided that the target has citation keys.
         """
         keys = [key.strip() for key in target.split(',')]
-        citations: Set[str] = {
-            cit.key for cit in self.citations
-            if cit.key in keys
-            and self.bibliographies[cit.bibliography_key].list_ == 'citation'}
-        if any(key in citations for key in keys):
+        if any(key in self.citation_index for key in keys):
             result_node = self.resolve_xref(
                 env, fromdocname, builder, 'p', target, node, contnode)
             return [('p', result_node)]
@@ -429,10 +580,38 @@ class BibtexDomain(Domain):
         """Yield all citation keys for given *docnames* in order, then
         ordered by citation order.
         """
-        for citation_ref in sorted(
-                self.citation_refs, key=lambda c: docnames.index(c.docname)):
-            for key in citation_ref.keys:
-                yield key
+        for docname in docnames:
+            for citation_ref in self.citation_refs.get(docname, []):
+                for key in citation_ref.keys:
+                    yield key
+
+    def get_cited_docnames(self) -> Dict[str, FrozenSet[str]]:
+        """Return map from each cited key to the names of the documents where
+        the key is cited.
+        """
+        if self.cited_docnames is None:
+            cited_docnames: Dict[str, Set[str]] = {}
+            for docname, citation_refs in self.citation_refs.items():
+                for citation_ref in citation_refs:
+                    for key in citation_ref.keys:
+                        cited_docnames.setdefault(key, set()).add(docname)
+            self.cited_docnames = {
+                key: frozenset(docnames)
+                for key, docnames in cited_docnames.items()}
+        return self.cited_docnames
+
+    def get_sorted_cited_keys(self, docnames: List[str]) -> List[str]:
+        """Return all unique citation keys for given *docnames* in order, then
+        ordered by citation order. The result is cached, as it is
+        needed for every bibliography.
+        """
+        docnames_key = tuple(docnames)
+        try:
+            return self.sorted_cited_keys[docnames_key]
+        except KeyError:
+            keys = self.sorted_cited_keys[docnames_key] = list(
+                dict.fromkeys(self.get_all_cited_keys(docnames)))
+            return keys
 
     def get_entries(
             self, bibfiles: List[str]) -> Iterable["Entry"]:
@@ -440,8 +619,7 @@ class BibtexDomain(Domain):
         in order of appearance in the bib files.
         """
         for bibfile in bibfiles:
-            for key in self.bibdata.bibfiles[bibfile].keys:
-                yield self.bibdata.data.entries[key]
+            yield from self.bibdata.bibfiles[bibfile].entries
 
     def get_filtered_entries(
             self, bibliography_key: "BibliographyKey"
@@ -450,27 +628,24 @@ class BibtexDomain(Domain):
         expression.
         """
         bibliography = self.bibliographies[bibliography_key]
+        filter_ = compile_filter(bibliography.filter_)
+        docname = bibliography_key.docname
+        all_cited_docnames = self.get_cited_docnames()
+        keyprefix = bibliography.keyprefix
+        listed_keys = set(bibliography.keys)
         for entry in self.get_entries(bibliography.bibfiles):
-            key = bibliography.keyprefix + entry.key
-            cited_docnames = {
-                citation_ref.docname
-                for citation_ref in self.citation_refs
-                if key in citation_ref.keys
-            }
-            visitor = _FilterVisitor(
-                entry=entry,
-                docname=bibliography_key.docname,
-                cited_docnames=cited_docnames)
+            key = keyprefix + entry.key
+            cited_docnames = all_cited_docnames.get(key, _EMPTY_DOCNAMES)
             try:
-                success = visitor.visit(bibliography.filter_)
+                success = filter_(entry, docname, cited_docnames)
             except ValueError as err:
                 logger.warning(
                     "syntax error in :filter: expression; %s" % err,
-                    location=(bibliography_key.docname, bibliography.line),
+                    location=(docname, bibliography.line),
                     type="bibtex", subtype="filter_syntax_error")
                 # recover by falling back to the default
                 success = bool(cited_docnames)
-            if success or entry.key in bibliography.keys:
+            if success or entry.key in listed_keys:
                 yield key, entry
 
     def get_sorted_entries(
@@ -479,7 +654,7 @@ class BibtexDomain(Domain):
         """Return filtered bibliography entries sorted by citation order."""
         entries = dict(
             self.get_filtered_entries(bibliography_key))
-        for key in self.get_all_cited_keys(docnames):
+        for key in self.get_sorted_cited_keys(docnames):
             try:
                 entry = entries.pop(key)
             except KeyError:
@@ -499,15 +674,14 @@ class BibtexDomain(Domain):
         with additional sorting and formatting applied from the pybtex style.
         """
         bibliography = self.bibliographies[bibliography_key]
-        entries = dict(
-            self.get_sorted_entries(bibliography_key, docnames))
-        style: BaseStyle = cast("BaseStyle", pybtex.plugin.find_plugin(
-            'pybtex.style.formatting', bibliography.style)())
+        entries: List[Entry] = [
+            entry for key, entry
+            in self.get_sorted_entries(bibliography_key, docnames)]
+        style: BaseStyle = find_formatting_style(bibliography.style)()
         style2: Optional[BaseStyle] = (
-            cast("BaseStyle", pybtex.plugin.find_plugin(
-                'pybtex.style.formatting', tooltips_style)())
+            find_formatting_style(tooltips_style)()
             if tooltips_style else style) if tooltips else None
-        sorted_entries: Iterable[Entry] = style.sort(entries.values())
+        sorted_entries: List[Entry] = style.sort(entries)
         labels = style.format_labels(sorted_entries)
         for label, entry in zip(labels, sorted_entries):
             try:
@@ -9,10 +9,10 @@ from typing import TYPE_CHECKING, cast, Tuple, List
 
 import docutils.nodes
 from docutils.nodes import make_id
-from pybtex.plugin import find_plugin
 from sphinx.roles import XRefRole
 from sphinx.util.logging import getLogger
 
+from .domain import find_formatting_style
 from .style.referencing import format_references
 from .style.template import FootReferenceInfo
 from .transforms import node_text_transform
@@ -55,9 +55,7 @@ class FootCiteRole(XRefRole):
                 foot_domain.bibliography_header.deepcopy()
         foot_old_refs = env.temp_data.setdefault("bibtex_foot_old_refs", set())
         foot_new_refs = env.temp_data.setdefault("bibtex_foot_new_refs", set())
-        style = find_plugin(
-            'pybtex.style.formatting',
-            self.config.bibtex_default_style)()
+        style = find_formatting_style(self.config.bibtex_default_style)()
         references = []
         domain = cast("BibtexDomain", self.env.get_domain('cite'))
         # count only incremented at directive, see foot_directives run method
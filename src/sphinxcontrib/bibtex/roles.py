@@ -10,7 +10,8 @@
 
 import docutils.nodes
 
-from typing import TYPE_CHECKING, cast, NamedTuple, List
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, cast, List
 from pybtex.plugin import find_plugin
 from sphinx.roles import XRefRole
 
@@ -18,8 +19,10 @@ if TYPE_CHECKING:
     from .domain import BibtexDomain
 
 
-class CitationRef(NamedTuple):
+@dataclass
+class CitationRef:
     """Information about a citation reference."""
+    __slots__ = ('citation_ref_id', 'docname', 'line', 'keys')
     citation_ref_id: str  #: Unique id of this citation reference.
     docname: str          #: Document name.
     line: int             #: Line number.
@@ -42,7 +45,7 @@ class CiteRole(XRefRole):
             node['reftype'] = 'p'
         document.note_explicit_target(node, node)  # for backrefs
         domain = cast("BibtexDomain", env.get_domain('cite'))
-        domain.citation_refs.append(CitationRef(
+        domain.citation_refs.setdefault(env.docname, []).append(CitationRef(
             citation_ref_id=node['ids'][0],
             docname=env.docname,
             line=document.line,
@@ -64,8 +64,7 @@ class BibliographyTransform(SphinxPostTransform):
             bib_key = BibliographyKey(
                 docname=bibnode['docname'], id_=bibnode['ids'][0])
             bibliography = domain.bibliographies[bib_key]
-            citations = [citation for citation in domain.citations
-                         if citation.bibliography_key == bib_key]
+            citations = domain.bibliography_citations.get(bib_key, [])
             # create citation nodes for all references
             if bibliography.list_ == "enumerated":
                 nodes = docutils.nodes.enumerated_list()
@@ -89,9 +88,9 @@ class BibliographyTransform(SphinxPostTransform):
                     # backrefs only supported in same document
                     backrefs = [
                         citation_ref.citation_ref_id
-                        for citation_ref in domain.citation_refs
-                        if bib_key.docname == citation_ref.docname
-                        and citation.key in citation_ref.keys]
+                        for citation_ref in domain.citation_refs.get(
+                            bib_key.docname, [])
+                        if citation.key in citation_ref.keys]
                     if backrefs:
                         citation_node['backrefs'] = backrefs
                     citation_node += docutils.nodes.label(
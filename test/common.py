@@ -1,7 +1,8 @@
 """Some common helper functions for the test suite."""
 
+import functools
 import re
-from typing import Optional
+from typing import Match, Optional, Pattern
 
 import sphinx
 import docutils
@@ -14,6 +15,16 @@ RE_DOCNAME = r'[^:]+'
 RE_TITLE = r'[^"]*'
 
 
+def one(pattern: Pattern, text: str) -> Match:
+    """Assert that *pattern* matches *text* exactly once, and return the
+    match, scanning *text* only once."""
+    matches = list(pattern.finditer(text))
+    assert len(matches) == 1
+    return matches[0]
+
+
+# all pattern factories are cached, so each pattern is compiled only once
+@functools.lru_cache(maxsize=None)
 def html_citation_refs(
         refid=RE_ID, label=RE_LABEL, title: Optional[str] = RE_TITLE):
     title_pattern = (
@@ -29,6 +40,7 @@ def html_citation_refs(
 
 # match single citation with square brackets
 # also gets the id of the citation itself (which will appear in backref)
+@functools.lru_cache(maxsize=None)
 def html_citation_refs_single(
         id_=RE_ID, refid=RE_ID, label=RE_LABEL,
         title: Optional[str] = RE_TITLE):
@@ -45,6 +57,7 @@ def html_citation_refs_single(
             id_=id_, refid=refid, label=label, title_pattern=title_pattern))
 
 
+@functools.lru_cache(maxsize=None)
 def html_docutils_citation_refs(refid=RE_ID, label=RE_LABEL, id_=RE_ID):
     return re.compile(
         r'<a class="reference internal" '
@@ -54,6 +67,7 @@ def html_docutils_citation_refs(refid=RE_ID, label=RE_LABEL, id_=RE_ID):
         r'</a>'.format(refid=refid, label=label, id_=id_))
 
 
+@functools.lru_cache(maxsize=None)
 def html_citations(id_=RE_ID, label=RE_LABEL, text=RE_TEXT):
     if docutils.__version_info__ < (0, 18):
         return re.compile(
@@ -95,6 +109,7 @@ def html_citations(id_=RE_ID, label=RE_LABEL, text=RE_TEXT):
                 id_=id_, label=label, text=text, backref_id=RE_ID))
 
 
+@functools.lru_cache(maxsize=None)
 def html_footnote_refs(refid=RE_ID):
     if docutils.__version_info__ < (0, 18):
         return re.compile(
@@ -113,6 +128,7 @@ def html_footnote_refs(refid=RE_ID):
             r'</a>'.format(refid=refid, id_=RE_ID, label=RE_NUM))
 
 
+@functools.lru_cache(maxsize=None)
 def html_footnotes(id_=RE_ID, text=RE_TEXT):
     if docutils.__version_info__ < (0, 18):
         return re.compile(
@@ -155,6 +171,7 @@ def html_footnotes(id_=RE_ID, text=RE_TEXT):
                 id_=id_, label=RE_NUM, text=text, backref_id=RE_ID))
 
 
+@functools.lru_cache(maxsize=None)
 def latex_citations(docname=RE_DOCNAME, id_=RE_ID,
                     label=RE_LABEL, text=RE_TEXT):
     if sphinx.version_info < (3, 5):
@@ -172,6 +189,7 @@ def latex_citations(docname=RE_DOCNAME, id_=RE_ID,
                 docname=docname, label=label, id_=id_, text=text))
 
 
+@functools.lru_cache(maxsize=None)
 def latex_citation_refs(docname=RE_DOCNAME, refid=RE_ID):
     return re.compile(
         rf'\\hyperlink{{cite[.](?P<docname>{docname}):(?P<refid>{refid})}}')
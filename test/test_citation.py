@@ -1,3 +1,5 @@
+import ast
+import pickle
 import pybtex.plugin
 from pybtex.style.formatting.unsrt import Style as UnsrtStyle
 from pybtex.style.template import words
@@ -21,8 +23,9 @@ from sphinxcontrib.bibtex.style.referencing.author_year import \
 @pytest.mark.sphinx('html', testroot='citation_not_found')
 def test_citation_not_found(app, warning) -> None:
     app.build()
-    assert 'could not find bibtex key "nosuchkey1"' in warning.getvalue()
-    assert 'could not find bibtex key "nosuchkey2"' in warning.getvalue()
+    warnings = warning.getvalue()
+    assert 'could not find bibtex key "nosuchkey1"' in warnings
+    assert 'could not find bibtex key "nosuchkey2"' in warnings
 
 
 # test mixing of ``:cite:`` and ``[]_`` (issue 2)
@@ -32,7 +35,8 @@ def test_citation_mixed(app, warning) -> None:
     assert not warning.getvalue()
     domain = cast(BibtexDomain, app.env.get_domain('cite'))
     assert len(domain.citation_refs) == 1
-    citation_ref = domain.citation_refs.pop()
+    assert len(domain.citation_refs['adoc1']) == 1
+    citation_ref = domain.citation_refs['adoc1'].pop()
     assert citation_ref.keys == ['Test']
     assert citation_ref.docname == 'adoc1'
     assert len(domain.citations) == 1
@@ -40,6 +44,25 @@ def test_citation_mixed(app, warning) -> None:
     assert citation.formatted_entry.label == '1'
 
 
+# domain data must survive pickling of the environment
+@pytest.mark.sphinx('html', testroot='citation_mixed')
+def test_citation_pickle(app, warning) -> None:
+    app.build()
+    assert not warning.getvalue()
+    domain = cast(BibtexDomain, app.env.get_domain('cite'))
+    data = pickle.loads(pickle.dumps(domain.data, pickle.HIGHEST_PROTOCOL))
+    assert data['citation_refs'] == domain.citation_refs
+    assert [(citation.citation_id, citation.bibliography_key, citation.key)
+            for citation in data['citations']] == [
+        (citation.citation_id, citation.bibliography_key, citation.key)
+        for citation in domain.citations]
+    assert list(data['bibliographies']) == list(domain.bibliographies)
+    for bib_key, bibliography in data['bibliographies'].items():
+        assert bibliography.keys == domain.bibliographies[bib_key].keys
+        assert ast.dump(bibliography.filter_) == ast.dump(
+            domain.bibliographies[bib_key].filter_)
+
+
 @pytest.mark.sphinx('html', testroot='citation_multiple_keys')
 def test_citation_multiple_keys(app, warning) -> None:
     app.build()
@@ -288,9 +311,11 @@ class CustomReferenceStyle(AuthorYearReferenceStyle):
     author_year_sep: str = ' '
 
 
-sphinxcontrib.bibtex.plugin.register_plugin(
-    'sphinxcontrib.bibtex.style.referencing',
-    'xxx_custom_xxx', CustomReferenceStyle)
+@pytest.fixture(autouse=True, scope='session')
+def register_custom_reference_style() -> None:
+    sphinxcontrib.bibtex.plugin.register_plugin(
+        'sphinxcontrib.bibtex.style.referencing',
+        'xxx_custom_xxx', CustomReferenceStyle)
 
 
 @pytest.mark.sphinx('text', testroot='citation_roles',
@@ -410,8 +435,11 @@ class CustomTooltipStyle(UnsrtStyle):
         return words['whoop whoop']
 
 
-pybtex.plugin.register_plugin(
-    'pybtex.style.formatting', 'xxx_custom_tooltip_xxx', CustomTooltipStyle)
+@pytest.fixture(autouse=True, scope='session')
+def register_custom_tooltip_style() -> None:
+    pybtex.plugin.register_plugin(
+        'pybtex.style.formatting', 'xxx_custom_tooltip_xxx',
+        CustomTooltipStyle)
 
 
 @pytest.mark.sphinx('html', testroot='debug_bibtex_citation',
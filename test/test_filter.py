@@ -68,4 +68,6 @@ def test_filter_option_clash(app, warning) -> None:
 @pytest.mark.sphinx('html', testroot='filter_syntax_error')
 def test_filter_syntax_error(app, warning) -> None:
     app.build()
-    assert warning.getvalue().count('syntax error in :filter: expression') == 9
+    warnings = warning.getvalue()
+    assert warnings.count('syntax error in :filter: expression') == 10
+    assert 'invalid regular expression' in warnings
@@ -64,9 +64,11 @@ class CustomReferenceStyle(FootReferenceStyle):
     person: PersonStyle = field(default_factory=my_person)
 
 
-sphinxcontrib.bibtex.plugin.register_plugin(
-    'sphinxcontrib.bibtex.style.referencing',
-    'xxx_foot_custom_xxx', CustomReferenceStyle)
+@pytest.fixture(autouse=True, scope='session')
+def register_custom_reference_style() -> None:
+    sphinxcontrib.bibtex.plugin.register_plugin(
+        'sphinxcontrib.bibtex.style.referencing',
+        'xxx_foot_custom_xxx', CustomReferenceStyle)
 
 
 @pytest.mark.sphinx('text', testroot='footcite_roles',